@@ -8,8 +8,10 @@ import pytest
 
 import cumulusci
 from cumulusci.cli.runtime import CliRuntime
-from cumulusci.core.config import OrgConfig
+from cumulusci.core.config import OrgConfig, UniversalConfig
 from cumulusci.core.exceptions import ConfigError, OrgNotFound
+from cumulusci.core.runtime import BaseCumulusCI
+from cumulusci.utils import temporary_dir
 
 
 class TestCliRuntime:
@@ -33,6 +35,118 @@ class TestCliRuntime:
             assert key in config.keychain.config
         assert config.project_config.repo_root in sys.path
 
+    def test_add_repo_to_path__once(self):
+        repo_root = CliRuntime().project_config.repo_root
+        path = [p for p in sys.path if p != repo_root]
+        with mock.patch.object(sys, "path", path):
+            CliRuntime()
+            CliRuntime()
+            assert sys.path.count(repo_root) == 1
+
+    @mock.patch.object(BaseCumulusCI, "_project_config_cache", {})
+    def test_load_project_config__cached(self):
+        first = CliRuntime()
+        with mock.patch(
+            "cumulusci.core.config.project_config.cci_safe_load"
+        ) as cci_safe_load:
+            second = CliRuntime()
+
+        cci_safe_load.assert_not_called()
+        assert second.project_config is not first.project_config
+        assert (
+            second.project_config.config_project == first.project_config.config_project
+        )
+        assert second.project_config.keychain is second.keychain
+
+        second.project_config.config["project"]["name"] = "Changed"
+        assert first.project_config.project__name == "CumulusCI"
+
+    @mock.patch.object(BaseCumulusCI, "_project_config_cache", {})
+    def test_load_project_config__cache_invalidated_by_commit(self):
+        CliRuntime()
+        with mock.patch(
+            "cumulusci.core.config.project_config.BaseProjectConfig.repo_commit",
+            new_callable=mock.PropertyMock,
+            return_value="0" * 40,
+        ), mock.patch(
+            "cumulusci.core.config.project_config.cci_safe_load",
+            return_value={"project": {"name": "Reloaded"}},
+        ):
+            config = CliRuntime()
+
+        assert config.project_config.project__name == "Reloaded"
+
+    @mock.patch.object(BaseCumulusCI, "_project_config_cache", {})
+    def test_load_project_config__cache_invalidated_by_yaml_edit(self):
+        with temporary_dir() as d:
+            os.mkdir(os.path.join(d, ".git"))
+            with open(os.path.join(d, ".git", "HEAD"), "w") as f:
+                f.write("abcdef")
+            with open("cumulusci.yml", "w") as f:
+                f.write("project:\n    name: Original\n")
+            CliRuntime()
+            with open("cumulusci.yml", "w") as f:
+                f.write("project:\n    name: Edited project\n")
+
+            config = CliRuntime()
+
+        assert config.project_config.project__name == "Edited project"
+
+    @mock.patch.object(BaseCumulusCI, "_project_config_cache", {})
+    def test_load_project_config__cache_invalidated_by_repo_env(self):
+        CliRuntime()
+        with mock.patch.dict(
+            os.environ,
+            {"CUMULUSCI_AUTO_DETECT": "1", "CUMULUSCI_REPO_COMMIT": "f" * 40},
+        ), mock.patch(
+            "cumulusci.core.config.project_config.cci_safe_load",
+            return_value={"project": {"name": "Reloaded"}},
+        ):
+            config = CliRuntime()
+
+            assert config.project_config.repo_commit == "f" * 40
+        assert config.project_config.project__name == "Reloaded"
+
+    @mock.patch.object(BaseCumulusCI, "_project_config_cache", {})
+    def test_load_project_config__cache_uses_own_universal_config(self):
+        class OtherUniversalConfig(UniversalConfig):
+            pass
+
+        CliRuntime()
+        second = CliRuntime()
+        assert second.project_config.universal_config_obj is second.universal_config
+
+        with mock.patch.object(
+            CliRuntime, "universal_config_class", OtherUniversalConfig
+        ), mock.patch(
+            "cumulusci.core.config.project_config.cci_safe_load",
+            return_value={"project": {"name": "Reloaded"}},
+        ):
+            other = CliRuntime()
+
+        assert other.project_config.project__name == "Reloaded"
+        assert isinstance(
+            other.project_config.universal_config_obj, OtherUniversalConfig
+        )
+
+    @mock.patch.object(BaseCumulusCI, "_project_config_cache", {})
+    def test_load_project_config__cache_disabled(self):
+        CliRuntime()
+        with mock.patch.dict(
+            os.environ, {"CUMULUSCI_DISABLE_CONFIG_CACHE": "1"}
+        ), mock.patch(
+            "cumulusci.core.config.project_config.cci_safe_load",
+            return_value={"project": {"name": "Reloaded"}},
+        ):
+            config = CliRuntime()
+
+        assert config.project_config.project__name == "Reloaded"
+
+    @mock.patch.object(BaseCumulusCI, "_project_config_cache", {})
+    def test_load_project_config__not_cached_with_kwargs(self):
+        CliRuntime(additional_yaml="project:\n    name: Additional")
+        assert not BaseCumulusCI._project_config_cache
+
     @mock.patch("cumulusci.cli.runtime.CliRuntime._load_project_config")
     def test_load_project_config_error(self, load_proj_cfg_mock):
         load_proj_cfg_mock.side_effect = ConfigError
@@ -1,3 +1,4 @@
+import copy
 import json
 import os
 import pathlib
@@ -9,7 +10,7 @@ from contextlib import contextmanager
 from io import StringIO
 from itertools import chain
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
 
 from github3 import GitHub
 from github3.repos.repo import Repository
@@ -526,6 +527,21 @@ class BaseProjectConfig(BaseTaskFlowConfig, ProjectConfigPropertiesMixin):
         if path.is_file():
             return str(path)
 
+    @property
+    def config_file_paths(self) -> List[str]:
+        """Paths of the YAML files this config is loaded from: the project,
+        project-local, global and plugin cumulusci.yml files."""
+        paths = [
+            self.config_project_path,
+            self.config_project_local_path,
+            self.universal_config_obj.config_global_path,
+        ]
+        for plugin in self.config_project.get("plugins", []):
+            module = sys.modules.get(plugin)
+            if module is not None:
+                paths.append(str(Path(module.__file__).parent / "cumulusci.yml"))
+        return [path for path in paths if path]
+
     @property
     def project_local_dir(self) -> str:
         """location of the user local directory for the project
@@ -588,6 +604,25 @@ class BaseProjectConfig(BaseTaskFlowConfig, ProjectConfigPropertiesMixin):
         except ValueError:
             pass
 
+    def copy(self) -> "BaseProjectConfig":
+        """Return a copy of this project config whose config dicts can be
+        changed without affecting the original. The keychain is not copied,
+        and repo info is detected again from the environment."""
+        other = copy.copy(self)
+        other.keychain = None
+        other._repo_info = None
+        for name in (
+            "config",
+            "config_project",
+            "config_project_local",
+            "config_additional_yaml",
+            "config_plugins",
+        ):
+            if name in vars(self):
+                setattr(other, name, copy.deepcopy(vars(self)[name]))
+        other.included_sources = dict(self.included_sources)
+        return other
+
     def set_keychain(self, keychain: "BaseProjectKeychain"):
         self.keychain = keychain
 
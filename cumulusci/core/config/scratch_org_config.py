@@ -1,6 +1,7 @@
 import datetime
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, NoReturn, Optional
 
 import sarge
@@ -12,7 +13,10 @@ from cumulusci.core.exceptions import (
     ScratchOrgException,
     ServiceNotConfigured,
 )
-from cumulusci.core.sfdx import sfdx
+from cumulusci.core.sfdx import read_output, sfdx
+
+SFDX_ORG_CREATE_ARGS = os.environ.get("SFDX_ORG_CREATE_ARGS", "")
+SFDX_SIGNUP_INSTANCE = os.environ.get("SFDX_SIGNUP_INSTANCE")
 
 
 class ScratchOrgConfig(SfdxOrgConfig):
@@ -27,6 +31,12 @@ class ScratchOrgConfig(SfdxOrgConfig):
 
     createable: bool = True
 
+    def __init__(self, config: dict, name: str, keychain=None, global_org=False):
+        self._password_pending = False
+        self._devhub_service_cache = None
+        self._scratch_def_cache = None
+        super().__init__(config, name, keychain, global_org)
+
     @property
     def scratch_info(self):
         """Deprecated alias for sfdx_info.
@@ -42,26 +52,46 @@ class ScratchOrgConfig(SfdxOrgConfig):
     @property
     def active(self) -> bool:
         """Check if an org is alive"""
-        return self.date_created and not self.expired
+        return self._days_alive(datetime.datetime.utcnow()) is not None
 
     @property
     def expired(self) -> bool:
         """Check if an org has already expired"""
-        return bool(self.expires) and self.expires < datetime.datetime.utcnow()
+        expires = self.expires
+        return bool(expires) and expires < datetime.datetime.utcnow()
 
     @property
     def expires(self) -> Optional[datetime.datetime]:
-        if self.date_created:
-            return self.date_created + datetime.timedelta(days=int(self.days))
+        date_created = self.date_created
+        if date_created:
+            return date_created + datetime.timedelta(days=int(self.days))
 
     @property
     def days_alive(self) -> Optional[int]:
-        if self.date_created and not self.expired:
-            delta = datetime.datetime.utcnow() - self.date_created
-            return delta.days + 1
+        return self._days_alive(datetime.datetime.utcnow())
+
+    def _days_alive(self, now: datetime.datetime) -> Optional[int]:
+        """Days the org has been alive as of `now`, or None if it isn't alive."""
+        date_created = self.date_created
+        if not date_created:
+            return None
+        expires = date_created + datetime.timedelta(days=int(self.days))
+        if expires < now:
+            return None
+        return (now - date_created).days + 1
 
     def create_org(self) -> None:
         """Uses sfdx force:org:create to create the org"""
+        p: sarge.Command = self._start_create_org()
+        self._finish_create_org(p)
+        self.flush_pending_passwords([self])
+
+    def _start_create_org(self, update_sfdx_config: bool = True) -> sarge.Command:
+        """Runs sfdx force:org:create and returns the finished command.
+
+        Pass update_sfdx_config=False to leave the alias and default username
+        off the create command, e.g. when several orgs are created at once
+        (see ScratchOrgBatch)."""
         if not self.config_file:
             raise ScratchOrgException(
                 f"Scratch org config {self.name} is missing a config_file"
@@ -69,44 +99,42 @@ class ScratchOrgConfig(SfdxOrgConfig):
         if not self.scratch_org_type:
             self.config["scratch_org_type"] = "workspace"
 
-        args: List[str] = self._build_org_create_args()
-        extra_args = os.environ.get("SFDX_ORG_CREATE_ARGS", "")
-        p: sarge.Command = sfdx(
-            f"force:org:create --json {extra_args}",
+        args: List[str] = self._build_org_create_args(
+            update_sfdx_config=update_sfdx_config
+        )
+        return sfdx(
+            f"force:org:create --json {SFDX_ORG_CREATE_ARGS}",
             args=args,
             username=None,
             log_note="Creating scratch org",
         )
-        stdout = p.stdout_text.read()
-        stderr = p.stderr_text.read()
 
-        def raise_error() -> NoReturn:
-            message = f"{FAILED_TO_CREATE_SCRATCH_ORG}: \n{stdout}\n{stderr}"
-            try:
-                output = json.loads(stdout)
-                if (
-                    output.get("message") == "The requested resource does not exist"
-                    and output.get("name") == "NOT_FOUND"
-                ):
-                    raise ScratchOrgException(
-                        "The Salesforce CLI was unable to create a scratch org. Ensure you are connected using a valid API version on an active Dev Hub."
-                    )
-            except json.decoder.JSONDecodeError:
-                raise ScratchOrgException(message)
-
-            raise ScratchOrgException(message)
+    def _finish_create_org(self, p: sarge.Command) -> None:
+        """Parses the output of force:org:create and records the new org."""
+        stdout, stderr = read_output(p)
 
-        result = {}  # for type checker.
-        if p.returncode:
-            raise_error()
         try:
-            result = json.loads(stdout)
-
+            result: Optional[dict] = json.loads(stdout)
         except json.decoder.JSONDecodeError:
-            raise_error()
+            result = None
+
+        def raise_error() -> NoReturn:
+            if (
+                isinstance(result, dict)
+                and result.get("message") == "The requested resource does not exist"
+                and result.get("name") == "NOT_FOUND"
+            ):
+                raise ScratchOrgException(
+                    "The Salesforce CLI was unable to create a scratch org. Ensure you are connected using a valid API version on an active Dev Hub."
+                )
+            raise ScratchOrgException(
+                f"{FAILED_TO_CREATE_SCRATCH_ORG}: \n{stdout}\n{stderr}"
+            )
 
         if (
-            not (res := result.get("result"))
+            p.returncode
+            or not isinstance(result, dict)
+            or not (res := result.get("result"))
             or ("username" not in res)
             or ("orgId" not in res)
         ):
@@ -123,21 +151,22 @@ class ScratchOrgConfig(SfdxOrgConfig):
 
         self.config["date_created"] = datetime.datetime.utcnow()
 
-        self.logger.error(stderr)
+        if stderr:
+            self.logger.debug(stderr)
 
         self.logger.info(
             f"Created: OrgId: {self.config['org_id']}, Username:{self.config['username']}"
         )
 
         if self.config.get("set_password"):
-            self.generate_password()
+            self._password_pending = True
 
         # Flag that this org has been created
         self.config["created"] = True
 
-    def _build_org_create_args(self) -> List[str]:
+    def _build_org_create_args(self, update_sfdx_config: bool = True) -> List[str]:
         args = ["-f", self.config_file, "-w", "120"]
-        devhub_username: Optional[str] = self._choose_devhub_username()
+        devhub_username: Optional[str] = self._devhub_username
         if devhub_username:
             args += ["--targetdevhubusername", devhub_username]
         if not self.namespaced:
@@ -148,20 +177,28 @@ class ScratchOrgConfig(SfdxOrgConfig):
             args += ["--durationdays", str(self.days)]
         if self.release:
             args += [f"release={self.release}"]
-        if self.sfdx_alias:
+        if update_sfdx_config and self.sfdx_alias:
             args += ["-a", self.sfdx_alias]
-        with open(self.config_file, "r") as org_def:
-            org_def_data = json.load(org_def)
-            org_def_has_email = "adminEmail" in org_def_data
+        org_def_has_email = "adminEmail" in self._scratch_def_data
         if self.email_address and not org_def_has_email:
             args += [f"adminEmail={self.email_address}"]
-        if self.default:
+        if update_sfdx_config and self.default:
             args += ["-s"]
-        if instance := self.instance or os.environ.get("SFDX_SIGNUP_INSTANCE"):
+        if instance := self.instance or SFDX_SIGNUP_INSTANCE:
             args += [f"instance={instance}"]
         return args
 
-    def _choose_devhub_username(self) -> Optional[str]:
+    @property
+    def _scratch_def_data(self) -> dict:
+        """The parsed scratch org definition file, read once per config_file."""
+        path = self.config_file
+        if self._scratch_def_cache is None or self._scratch_def_cache[0] != path:
+            with open(path, "r") as org_def:
+                self._scratch_def_cache = (path, json.load(org_def))
+        return self._scratch_def_cache[1]
+
+    @property
+    def _devhub_username(self) -> Optional[str]:
         """Determine which devhub username to specify when calling sfdx, if any."""
         # If a devhub was specified via `cci org scratch`, use it.
         # (This will return None if "devhub" isn't set in the org config,
@@ -169,18 +206,72 @@ class ScratchOrgConfig(SfdxOrgConfig):
         devhub_username = self.devhub
         if not devhub_username and self.keychain is not None:
             # Otherwise see if one is configured via the "devhub" service
+            devhub_username = self._devhub_service_username()
+        return devhub_username
+
+    def _devhub_service_username(self) -> Optional[str]:
+        """The "devhub" service's username, looked up once per keychain."""
+        keychain = self.keychain
+        if self._devhub_service_cache is None or (
+            self._devhub_service_cache[0] is not keychain
+        ):
             try:
-                devhub_service = self.keychain.get_service("devhub")
+                devhub_service = keychain.get_service("devhub")
             except (ServiceNotConfigured, CumulusCIException):
-                pass
+                username = None
             else:
-                devhub_username = devhub_service.username
-        return devhub_username
+                username = devhub_service.username
+            self._devhub_service_cache = (keychain, username)
+        return self._devhub_service_cache[1]
+
+    def set_alias(self) -> None:
+        """Points the org's sfdx alias at its username with sfdx force:alias:set."""
+        p: sarge.Command = sfdx(
+            sarge.shell_format("force:alias:set {}={}", self.sfdx_alias, self.username),
+            log_note="Setting scratch org alias",
+        )
+        if p.returncode:
+            raise ScratchOrgException(
+                f"Failed to set alias {self.sfdx_alias}: \n{p.stderr_text.read()}"
+            )
+
+    def set_sfdx_default(self) -> None:
+        """Makes the org sfdx's default username with sfdx force:config:set."""
+        p: sarge.Command = sfdx(
+            sarge.shell_format("force:config:set defaultusername={}", self.username),
+            log_note="Setting scratch org as sfdx default",
+        )
+        if p.returncode:
+            raise ScratchOrgException(
+                f"Failed to set {self.username} as the sfdx default username: \n{p.stderr_text.read()}"
+            )
+
+    @staticmethod
+    def flush_pending_passwords(
+        org_configs: List["ScratchOrgConfig"], max_workers: Optional[int] = None
+    ) -> None:
+        """Generates passwords for newly created orgs that have set_password.
+
+        force:user:password:generate can only batch users of a single org,
+        so batches of orgs are handled concurrently instead."""
+        pending = [
+            org_config for org_config in org_configs if org_config._password_pending
+        ]
+        if not pending:
+            return
+        if len(pending) == 1:
+            pending[0].generate_password()
+            return
+        with ThreadPoolExecutor(max_workers=max_workers or len(pending)) as executor:
+            list(
+                executor.map(lambda org_config: org_config.generate_password(), pending)
+            )
 
     def generate_password(self) -> None:
         """Generates an org password with: sfdx force:user:password:generate.
         On a non-zero return code, set the password_failed in our config
         and log the output (stdout/stderr) from sfdx."""
+        self._password_pending = False
 
         if self.password_failed:
             self.logger.warning("Skipping resetting password since last attempt failed")
@@ -194,20 +285,18 @@ class ScratchOrgConfig(SfdxOrgConfig):
 
         if p.returncode:
             self.config["password_failed"] = True
-            stderr = p.stderr_text.readlines()
-            stdout = p.stdout_text.readlines()
+            stdout, stderr = read_output(p)
             # Don't throw an exception because of failure creating the
             # password, just notify in a log message
-            nl = "\n"  # fstrings can't contain backslashes
-            self.logger.warning(
-                f"Failed to set password: \n{nl.join(stdout)}\n{nl.join(stderr)}"
-            )
+            self.logger.warning(f"Failed to set password: \n{stdout}\n{stderr}")
 
     def format_org_days(self) -> str:
-        if self.days_alive:
-            org_days = f"{self.days_alive}/{self.days}"
+        days = self.days
+        days_alive = self.days_alive
+        if days_alive:
+            org_days = f"{days_alive}/{days}"
         else:
-            org_days = str(self.days)
+            org_days = str(days)
         return org_days
 
     def can_delete(self) -> bool:
@@ -222,7 +311,8 @@ class ScratchOrgConfig(SfdxOrgConfig):
         p: sarge.Command = sfdx(
             "force:org:delete -p", self.username, "Deleting scratch org"
         )
-        sfdx_output: List[str] = list(p.stdout_text) + list(p.stderr_text)
+        stdout, stderr = read_output(p)
+        sfdx_output: List[str] = stdout.splitlines() + stderr.splitlines()
 
         for line in sfdx_output:
             if "error" in line.lower():
@@ -240,3 +330,66 @@ class ScratchOrgConfig(SfdxOrgConfig):
         self.config["date_created"] = None
         self.config["instance_url"] = None
         self.save()
+
+
+class ScratchOrgBatch:
+    """Creates several scratch orgs concurrently.
+
+    Creating a scratch org is mostly spent waiting on the Dev Hub, so orgs
+    are created on a small pool of worker threads. The alias and default
+    username are left off force:org:create and set one org at a time once
+    the pool is done, because concurrent sfdx calls that write them can
+    clobber each other's entries in the sfdx alias and config files."""
+
+    # Keeps concurrent creates well under Dev Hub limits
+    DEFAULT_MAX_WORKERS = 4
+
+    def __init__(
+        self, org_configs: List[ScratchOrgConfig], max_workers: Optional[int] = None
+    ):
+        self.org_configs = org_configs
+        self.max_workers = max_workers or self.DEFAULT_MAX_WORKERS
+
+    def create_orgs(self) -> None:
+        """Creates every org in the batch.
+
+        Waits for all creates to finish and sets up every org that was
+        created, then raises the first create error, or else the first
+        setup error, if any."""
+        if not self.org_configs:
+            return
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self._create_org, org_config)
+                for org_config in self.org_configs
+            ]
+
+        created = [
+            org_config
+            for org_config, future in zip(self.org_configs, futures)
+            if future.exception() is None
+        ]
+        setup_errors = []
+        for org_config in created:
+            try:
+                self._set_up_org(org_config)
+            except Exception as e:
+                setup_errors.append(e)
+        ScratchOrgConfig.flush_pending_passwords(created, max_workers=self.max_workers)
+
+        for future in futures:
+            future.result()
+        if setup_errors:
+            raise setup_errors[0]
+
+    @staticmethod
+    def _create_org(org_config: ScratchOrgConfig) -> None:
+        p: sarge.Command = org_config._start_create_org(update_sfdx_config=False)
+        org_config._finish_create_org(p)
+
+    @staticmethod
+    def _set_up_org(org_config: ScratchOrgConfig) -> None:
+        if org_config.sfdx_alias:
+            org_config.set_alias()
+        if org_config.default:
+            org_config.set_sfdx_default()
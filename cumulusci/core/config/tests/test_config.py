@@ -2,6 +2,7 @@
 import json
 import os
 import pathlib
+import sys
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest import mock
@@ -459,6 +460,40 @@ class TestBaseProjectConfig:
 
             assert config.repo_commit is not None
 
+    def test_copy(self):
+        config = BaseProjectConfig(UniversalConfig(), {"project": {"name": "Test"}})
+        config.keychain = DummyKeychain()
+
+        other = config.copy()
+        other.config["project"]["name"] = "Changed"
+
+        assert config.project__name == "Test"
+        assert other.project__name == "Changed"
+        assert other.keychain is None
+        assert other.universal_config_obj is config.universal_config_obj
+
+    def test_copy__redetects_repo_info(self):
+        config = BaseProjectConfig(UniversalConfig(), {"project": {"name": "Test"}})
+        config._repo_info = {"commit": "abcdef"}
+
+        assert config.copy()._repo_info is None
+
+    def test_config_file_paths(self):
+        with temporary_dir() as d:
+            os.mkdir(os.path.join(d, ".git"))
+            touch("cumulusci.yml")
+            config = BaseProjectConfig(UniversalConfig(), {"project": {"name": "Test"}})
+            config.config_project["plugins"] = ["cumulusci", "not_imported_plugin"]
+
+            paths = config.config_file_paths
+
+        assert paths[0] == str(Path(d, "cumulusci.yml"))
+        assert (
+            str(Path(sys.modules["cumulusci"].__file__).parent / "cumulusci.yml")
+            in paths
+        )
+        assert not any("not_imported_plugin" in path for path in paths)
+
     def test_get_repo_from_url(self):
         config = BaseProjectConfig(
             UniversalConfig(),
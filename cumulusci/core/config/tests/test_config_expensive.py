@@ -2,6 +2,7 @@ import io
 import os
 import shutil
 import tempfile
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest import mock
@@ -16,6 +17,7 @@ from cumulusci.core.config import (
     SfdxOrgConfig,
     UniversalConfig,
 )
+from cumulusci.core.config.scratch_org_config import ScratchOrgBatch
 from cumulusci.core.exceptions import (
     NotInProject,
     ProjectConfigNotFound,
@@ -557,6 +559,14 @@ class TestScratchOrgConfig:
         config.date_created = datetime.now()
         assert config.days_alive == 1
 
+    def test_days_alive__expired(self, Command):
+        config = ScratchOrgConfig({"days": 1}, "test")
+        config.date_created = datetime.now() - timedelta(days=2)
+        assert config.days_alive is None
+
+        config.date_created = None
+        assert config.days_alive is None
+
     def test_active(self, Command):
         config = ScratchOrgConfig({}, "test")
         config.date_created = None
@@ -606,6 +616,24 @@ class TestScratchOrgConfig:
         assert config.config["created"]
         assert config.scratch_org_type == "workspace"
 
+    def test_create_org__no_set_password(self, Command):
+        out = b"""{"result": {"orgId": "ORG_ID", "username": "USERNAME"}}"""
+        Command.return_value = p = mock.Mock(
+            stdout=io.BytesIO(out), stderr=io.BytesIO(b""), returncode=0
+        )
+
+        config = ScratchOrgConfig(
+            {"config_file": "tmp.json", "email_address": "test@example.com"}, "test"
+        )
+        with temporary_dir():
+            with open("tmp.json", "w") as f:
+                f.write("{}")
+
+            config.create_org()
+
+        p.run.assert_called_once()
+        assert not config._password_pending
+
     def test_check_apiversion_error(self, Command):
         out = b"""{
             "context": "Create",
@@ -651,6 +679,112 @@ class TestScratchOrgConfig:
                 config.create_org()
             assert "scratcherror" in str(e.value)
 
+    def test_set_alias(self, Command):
+        Command.return_value = p = mock.Mock(
+            stdout=io.BytesIO(b""), stderr=io.BytesIO(b""), returncode=0
+        )
+
+        config = ScratchOrgConfig(
+            {"username": "test@example.com", "sfdx_alias": "project__dev"}, "test"
+        )
+        config.set_alias()
+
+        p.run.assert_called_once()
+        assert (
+            "force:alias:set project__dev=test@example.com" in Command.call_args[0][0]
+        )
+
+    def test_set_alias_error(self, Command):
+        Command.return_value = mock.Mock(
+            stdout=io.BytesIO(b""), stderr=io.BytesIO(b"aliaserror"), returncode=1
+        )
+
+        config = ScratchOrgConfig(
+            {"username": "test@example.com", "sfdx_alias": "project__dev"}, "test"
+        )
+        with pytest.raises(ScratchOrgException, match="aliaserror"):
+            config.set_alias()
+
+    @mock.patch(
+        "cumulusci.core.config.scratch_org_config.SFDX_ORG_CREATE_ARGS",
+        "--loglevel debug",
+    )
+    def test_create_org_extra_args(self, Command):
+        out = b"""{"result": {"orgId": "ORG_ID", "username": "USERNAME"}}"""
+        Command.return_value = mock.Mock(
+            stdout=io.BytesIO(out), stderr=io.BytesIO(b""), returncode=0
+        )
+
+        config = ScratchOrgConfig(
+            {"config_file": "tmp.json", "email_address": "test@example.com"}, "test"
+        )
+        with temporary_dir():
+            with open("tmp.json", "w") as f:
+                f.write("{}")
+
+            config.create_org()
+
+        assert Command.call_args[0][0].startswith(
+            "sfdx force:org:create --json --loglevel debug"
+        )
+
+    def test_create_org_non_json_output(self, Command):
+        Command.return_value = mock.Mock(
+            stdout=io.BytesIO(b"<html></html>"), stderr=io.BytesIO(b""), returncode=0
+        )
+
+        config = ScratchOrgConfig(
+            {"config_file": "tmp.json", "email_address": "test@example.com"}, "test"
+        )
+        with temporary_dir():
+            with open("tmp.json", "w") as f:
+                f.write("{}")
+
+            with pytest.raises(ScratchOrgException, match="<html></html>"):
+                config.create_org()
+
+    def test_create_org_logs_stderr_as_debug(self, Command):
+        out = b"""{"result": {"orgId": "ORG_ID", "username": "USERNAME"}}"""
+        Command.return_value = mock.Mock(
+            stdout=io.BytesIO(out), stderr=io.BytesIO(b"a warning"), returncode=0
+        )
+
+        config = ScratchOrgConfig(
+            {"config_file": "tmp.json", "email_address": "test@example.com"}, "test"
+        )
+        config.logger = mock.Mock()
+        with temporary_dir():
+            with open("tmp.json", "w") as f:
+                f.write("{}")
+
+            config.create_org()
+
+        config.logger.debug.assert_called_once_with("a warning")
+        config.logger.error.assert_not_called()
+
+    def test_set_sfdx_default(self, Command):
+        Command.return_value = p = mock.Mock(
+            stdout=io.BytesIO(b""), stderr=io.BytesIO(b""), returncode=0
+        )
+
+        config = ScratchOrgConfig({"username": "test@example.com"}, "test")
+        config.set_sfdx_default()
+
+        p.run.assert_called_once()
+        assert (
+            "force:config:set defaultusername=test@example.com"
+            in Command.call_args[0][0]
+        )
+
+    def test_set_sfdx_default_error(self, Command):
+        Command.return_value = mock.Mock(
+            stdout=io.BytesIO(b""), stderr=io.BytesIO(b"configerror"), returncode=1
+        )
+
+        config = ScratchOrgConfig({"username": "test@example.com"}, "test")
+        with pytest.raises(ScratchOrgException, match="configerror"):
+            config.set_sfdx_default()
+
     def test_generate_password(self, Command):
         p = mock.Mock(
             stderr=io.BytesIO(b"error"), stdout=io.BytesIO(b"out"), returncode=0
@@ -662,6 +796,40 @@ class TestScratchOrgConfig:
 
         p.run.assert_called_once()
 
+    def test_generate_password__clears_pending(self, Command):
+        Command.return_value = mock.Mock(
+            stderr=io.BytesIO(b""), stdout=io.BytesIO(b""), returncode=0
+        )
+
+        config = ScratchOrgConfig({"username": "test"}, "test")
+        config._password_pending = True
+        config.generate_password()
+
+        assert not config._password_pending
+
+    def test_flush_pending_passwords(self, Command):
+        pending = ScratchOrgConfig({"username": "pending"}, "pending")
+        pending._password_pending = True
+        pending.generate_password = mock.Mock()
+        done = ScratchOrgConfig({"username": "done"}, "done")
+        done.generate_password = mock.Mock()
+
+        ScratchOrgConfig.flush_pending_passwords([pending, done])
+
+        pending.generate_password.assert_called_once()
+        done.generate_password.assert_not_called()
+
+    @mock.patch("cumulusci.core.config.scratch_org_config.ThreadPoolExecutor")
+    def test_flush_pending_passwords__single_org_inline(self, Executor, Command):
+        config = ScratchOrgConfig({"username": "test"}, "test")
+        config._password_pending = True
+        config.generate_password = mock.Mock()
+
+        ScratchOrgConfig.flush_pending_passwords([config])
+
+        config.generate_password.assert_called_once()
+        Executor.assert_not_called()
+
     def test_generate_password_failed(self, Command):
         p = mock.Mock()
         p.stderr = io.BytesIO(b"error")
@@ -769,14 +937,36 @@ class TestScratchOrgConfig:
         )
         config = ScratchOrgConfig({}, "test", mock_keychain)
 
-        assert config._choose_devhub_username() == "fake@fake.devhub"
+        assert config._devhub_username == "fake@fake.devhub"
+        assert config._devhub_username == "fake@fake.devhub"
+        mock_keychain.get_service.assert_called_once_with("devhub")
+
+    def test_choose_devhub__follows_devhub_and_keychain(self, Command):
+        config = ScratchOrgConfig({}, "test")
+        assert config._devhub_username is None
+
+        config.config["devhub"] = "explicit@fake.devhub"
+        assert config._devhub_username == "explicit@fake.devhub"
+
+        del config.config["devhub"]
+        config.keychain = mock.Mock()
+        config.keychain.get_service.return_value = ServiceConfig(
+            {"username": "fake@fake.devhub"}
+        )
+        assert config._devhub_username == "fake@fake.devhub"
+
+        config.keychain = mock.Mock()
+        config.keychain.get_service.return_value = ServiceConfig(
+            {"username": "other@fake.devhub"}
+        )
+        assert config._devhub_username == "other@fake.devhub"
 
     def test_choose_devhub__service_not_configured(self, Command):
         mock_keychain = mock.Mock()
         mock_keychain.get_service.side_effect = ServiceNotConfigured
         config = ScratchOrgConfig({}, "test", mock_keychain)
 
-        assert config._choose_devhub_username() is None
+        assert config._devhub_username is None
 
 
 class TestScratchOrgConfigPytest:
@@ -818,6 +1008,22 @@ class TestScratchOrgConfigPytest:
             "instance=NA01",
         ]
 
+    @mock.patch("cumulusci.core.config.scratch_org_config.SFDX_SIGNUP_INSTANCE", "CS42")
+    def test_build_org_create_args__signup_instance(self, scratch_def_file):
+        config = ScratchOrgConfig({"config_file": "tmp.json"}, "test")
+        args = config._build_org_create_args()
+        assert args[-1] == "instance=CS42"
+
+    def test_build_org_create_args__no_sfdx_config(self, scratch_def_file):
+        config = ScratchOrgConfig(
+            {"config_file": "tmp.json", "sfdx_alias": "project__org", "default": True},
+            "test",
+        )
+        args = config._build_org_create_args(update_sfdx_config=False)
+        assert "-a" not in args
+        assert "project__org" not in args
+        assert "-s" not in args
+
     def test_build_org_create_args__email_in_scratch_def(self):
         config = ScratchOrgConfig(
             {
@@ -834,8 +1040,228 @@ class TestScratchOrgConfigPytest:
 
         assert "adminEmail=test@example.com" not in args
 
+    def test_scratch_def_data_read_once(self, scratch_def_file):
+        config = ScratchOrgConfig({"config_file": "tmp.json"}, "test")
+        with mock.patch("builtins.open", wraps=open) as mock_open:
+            config._build_org_create_args()
+            config._build_org_create_args()
+        mock_open.assert_called_once_with("tmp.json", "r")
+        assert config._scratch_def_data == {}
+
+    def test_scratch_def_data__follows_config_file(self, scratch_def_file):
+        config = ScratchOrgConfig(
+            {
+                "config_file": "tmp.json",
+                "set_password": True,
+                "email_address": "test@example.com",
+            },
+            "test",
+        )
+        assert "adminEmail=test@example.com" in config._build_org_create_args()
+
+        with open("other.json", "w") as f:
+            f.write('{"adminEmail": "other_test@example.com"}')
+        config.config["config_file"] = "other.json"
+
+        assert "adminEmail=test@example.com" not in config._build_org_create_args()
+
     def test_temporary_backwards_compatiblity_hacks(self):
         filename = Path(__file__).parent / "_test_config_backwards_compatibility.py"
         # run this in a separate process to not confuse
         # the module table
         assert os.system(f"pytest {filename}") == 0
+
+
+@mock.patch("sarge.Command")
+class TestScratchOrgBatch:
+    def _org_config(self, name):
+        config = ScratchOrgConfig(
+            {
+                "config_file": "tmp.json",
+                "email_address": "test@example.com",
+                "sfdx_alias": f"project__{name}",
+            },
+            name,
+        )
+        config.set_alias = mock.Mock()
+        return config
+
+    def test_create_orgs(self, Command, scratch_def_file):
+        def command(cmd, **kw):
+            out = b"""{"result": {"orgId": "ORG_ID", "username": "USERNAME"}}"""
+            return mock.Mock(
+                stdout=io.BytesIO(out), stderr=io.BytesIO(b""), returncode=0
+            )
+
+        Command.side_effect = command
+        configs = [self._org_config("dev"), self._org_config("qa")]
+
+        ScratchOrgBatch(configs).create_orgs()
+
+        assert Command.call_count == 2
+        for config in configs:
+            assert config.config["created"]
+            assert config.config["org_id"] == "ORG_ID"
+            config.set_alias.assert_called_once()
+        for call in Command.call_args_list:
+            assert "-a" not in call[0][0].split()
+
+    def test_create_orgs__sfdx_config_set_after_creates(
+        self, Command, scratch_def_file
+    ):
+        calls = []
+
+        def command(cmd, **kw):
+            calls.append((cmd, threading.current_thread()))
+            out = b"""{"result": {"orgId": "ORG_ID", "username": "USERNAME"}}"""
+            return mock.Mock(
+                stdout=io.BytesIO(out), stderr=io.BytesIO(b""), returncode=0
+            )
+
+        Command.side_effect = command
+        configs = [
+            ScratchOrgConfig(
+                {
+                    "config_file": "tmp.json",
+                    "email_address": "test@example.com",
+                    "sfdx_alias": f"project__{name}",
+                    "default": name == "dev",
+                },
+                name,
+            )
+            for name in ("dev", "qa", "feature")
+        ]
+
+        ScratchOrgBatch(configs).create_orgs()
+
+        commands = [cmd for cmd, thread in calls]
+        creates = [i for i, cmd in enumerate(commands) if "force:org:create" in cmd]
+        updates = [
+            i
+            for i, cmd in enumerate(commands)
+            if "force:alias:set" in cmd or "force:config:set" in cmd
+        ]
+        assert len(creates) == 3
+        assert len(updates) == 4
+        assert max(creates) < min(updates)
+        for i in updates:
+            assert calls[i][1] is threading.main_thread()
+        for i in creates:
+            assert "-a" not in commands[i].split()
+            assert "-s" not in commands[i].split()
+
+    def test_max_workers_default(self, Command):
+        assert ScratchOrgBatch([]).max_workers == ScratchOrgBatch.DEFAULT_MAX_WORKERS
+        assert ScratchOrgBatch([], max_workers=10).max_workers == 10
+
+    def test_create_orgs__set_password(self, Command, scratch_def_file):
+        out = b"""{"result": {"orgId": "ORG_ID", "username": "USERNAME"}}"""
+        Command.side_effect = lambda cmd, **kw: mock.Mock(
+            stdout=io.BytesIO(out), stderr=io.BytesIO(b""), returncode=0
+        )
+        configs = [self._org_config("dev"), self._org_config("qa")]
+        for config in configs:
+            config.config["set_password"] = True
+            config.generate_password = mock.Mock()
+
+        ScratchOrgBatch(configs).create_orgs()
+
+        for config in configs:
+            config.generate_password.assert_called_once()
+
+    def test_create_orgs__error(self, Command, scratch_def_file):
+        Command.return_value = mock.Mock(
+            stdout=io.BytesIO(b""), stderr=io.BytesIO(b"scratcherror"), returncode=1
+        )
+        config = self._org_config("dev")
+
+        with pytest.raises(ScratchOrgException, match="scratcherror"):
+            ScratchOrgBatch([config]).create_orgs()
+        config.set_alias.assert_not_called()
+
+    def test_create_orgs__error_still_sets_up_created_orgs(
+        self, Command, scratch_def_file
+    ):
+        def command(cmd, **kw):
+            if "bad.json" in cmd:
+                return mock.Mock(
+                    stdout=io.BytesIO(b""),
+                    stderr=io.BytesIO(b"scratcherror"),
+                    returncode=1,
+                )
+            out = b"""{"result": {"orgId": "ORG_ID", "username": "USERNAME"}}"""
+            return mock.Mock(
+                stdout=io.BytesIO(out), stderr=io.BytesIO(b""), returncode=0
+            )
+
+        Command.side_effect = command
+        with open("bad.json", "w") as f:
+            f.write("{}")
+        good = self._org_config("good")
+        bad = self._org_config("bad")
+        bad.config["config_file"] = "bad.json"
+        for config in (good, bad):
+            config.config["set_password"] = True
+            config.generate_password = mock.Mock()
+
+        with pytest.raises(ScratchOrgException, match="scratcherror"):
+            ScratchOrgBatch([good, bad]).create_orgs()
+
+        assert good.config["created"]
+        good.set_alias.assert_called_once()
+        good.generate_password.assert_called_once()
+        assert not bad.config.get("created")
+        bad.set_alias.assert_not_called()
+        bad.generate_password.assert_not_called()
+
+    def test_create_orgs__alias_error_still_sets_up_other_orgs(
+        self, Command, scratch_def_file
+    ):
+        out = b"""{"result": {"orgId": "ORG_ID", "username": "USERNAME"}}"""
+        Command.side_effect = lambda cmd, **kw: mock.Mock(
+            stdout=io.BytesIO(out), stderr=io.BytesIO(b""), returncode=0
+        )
+        first = self._org_config("first")
+        second = self._org_config("second")
+        first.set_alias.side_effect = ScratchOrgException("aliaserror")
+        for config in (first, second):
+            config.config["set_password"] = True
+            config.generate_password = mock.Mock()
+
+        with pytest.raises(ScratchOrgException, match="aliaserror"):
+            ScratchOrgBatch([first, second]).create_orgs()
+
+        second.set_alias.assert_called_once()
+        for config in (first, second):
+            assert config.config["created"]
+            config.generate_password.assert_called_once()
+
+    def test_create_orgs__create_error_raised_before_setup_error(
+        self, Command, scratch_def_file
+    ):
+        def command(cmd, **kw):
+            if "bad.json" in cmd:
+                return mock.Mock(
+                    stdout=io.BytesIO(b""),
+                    stderr=io.BytesIO(b"scratcherror"),
+                    returncode=1,
+                )
+            out = b"""{"result": {"orgId": "ORG_ID", "username": "USERNAME"}}"""
+            return mock.Mock(
+                stdout=io.BytesIO(out), stderr=io.BytesIO(b""), returncode=0
+            )
+
+        Command.side_effect = command
+        with open("bad.json", "w") as f:
+            f.write("{}")
+        good = self._org_config("good")
+        good.set_alias.side_effect = ScratchOrgException("aliaserror")
+        bad = self._org_config("bad")
+        bad.config["config_file"] = "bad.json"
+
+        with pytest.raises(ScratchOrgException, match="scratcherror"):
+            ScratchOrgBatch([good, bad]).create_orgs()
+
+    def test_create_orgs__empty(self, Command):
+        ScratchOrgBatch([]).create_orgs()
+        Command.assert_not_called()
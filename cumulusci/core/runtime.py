@@ -1,6 +1,7 @@
+import os
 import sys
 from abc import abstractmethod
-from typing import Optional, Type
+from typing import Dict, Optional, Tuple, Type
 
 from cumulusci.core.config import BaseProjectConfig, UniversalConfig
 from cumulusci.core.debug import DebugMode, get_debug_mode
@@ -8,6 +9,12 @@ from cumulusci.core.exceptions import NotInProject, ProjectConfigNotFound
 from cumulusci.core.flowrunner import FlowCallback, FlowCoordinator
 from cumulusci.core.keychain import BaseProjectKeychain
 
+ConfigState = Tuple[
+    Optional[str],
+    Optional[str],
+    Tuple[Tuple[str, Optional[int], Optional[int]], ...],
+]
+
 
 # pylint: disable=assignment-from-none
 class BaseCumulusCI:
@@ -22,6 +29,14 @@ class BaseCumulusCI:
     debug_mode: DebugMode
     project_config_error: Exception
 
+    # Project configs loaded without arguments, reused (as copies) by runtimes
+    # created in the same directory. Maps (universal_config_cls,
+    # project_config_cls, cwd) to a pristine config and the state of the repo
+    # and YAML files it was loaded from.
+    _project_config_cache: Dict[
+        Tuple[Type, Type, str], Tuple[BaseProjectConfig, ConfigState]
+    ] = {}
+
     def __init__(self, *args, load_keychain=True, **kwargs):
         self.keychain = None
         self.debug_mode = get_debug_mode()
@@ -73,18 +88,43 @@ class BaseCumulusCI:
         return None
 
     def _add_repo_to_path(self):
-        if self.project_config and self.project_config.repo_root:
-            sys.path.append(self.project_config.repo_root)
+        if self.project_config:
+            repo_root = self.project_config.repo_root
+            if repo_root and repo_root not in sys.path:
+                sys.path.append(repo_root)
 
     def _load_universal_config(self):
         self.universal_config = self.universal_config_cls()
 
     def _load_project_config(self, *args, **kwargs):
+        cache_key = None
+        if not (args or kwargs or os.environ.get("CUMULUSCI_DISABLE_CONFIG_CACHE")):
+            cache_key = (
+                type(self.universal_config),
+                self.project_config_cls,
+                os.getcwd(),
+            )
+            cached = self._project_config_cache.get(cache_key)
+            if cached is not None:
+                cached_config, config_state = cached
+                project_config = cached_config.copy()
+                project_config.universal_config_obj = self.universal_config
+                if _config_state(project_config) == config_state:
+                    self.project_config = project_config
+                    return
+
         self.project_config = self.project_config_cls(
             self.universal_config, *args, **kwargs
         )
         if self.project_config is not None:
             self.project_config._add_tasks_directory_to_python_path()
+            if cache_key is not None:
+                config_state = _config_state(self.project_config)
+                if config_state is not None:
+                    self._project_config_cache[cache_key] = (
+                        self.project_config.copy(),
+                        config_state,
+                    )
 
     def _load_keychain(self):
         if self.keychain is not None:
@@ -113,3 +153,25 @@ class BaseCumulusCI:
             callbacks=callbacks,
         )
         return coordinator
+
+
+def _file_state(path: str) -> Tuple[str, Optional[int], Optional[int]]:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return (path, None, None)
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+
+def _config_state(project_config: BaseProjectConfig) -> Optional[ConfigState]:
+    """The repo root and commit plus the path, mtime and size of each YAML
+    file a project config was loaded from, or None if they can't be
+    determined (e.g. a repo with no commits yet)."""
+    try:
+        return (
+            project_config.repo_root,
+            project_config.repo_commit,
+            tuple(_file_state(path) for path in project_config.config_file_paths),
+        )
+    except OSError:
+        return None
@@ -66,6 +66,16 @@ def sfdx(
     return p
 
 
+def read_output(p: sarge.Command) -> T.Tuple[str, str]:
+    """Read the captured stdout and stderr of a command run by `sfdx`.
+
+    Each `sarge.Capture` drains its pipe on its own reader thread while the
+    command runs, so the two streams can be read one after the other here
+    without the child ever blocking on a full pipe.
+    """
+    return p.stdout_text.read(), p.stderr_text.read()
+
+
 def shell_quote(s: str):
     if platform.system() == "Windows":
         assert isinstance(s, str)
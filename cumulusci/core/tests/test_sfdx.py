@@ -11,6 +11,7 @@ from cumulusci.core.sfdx import (
     get_default_devhub_username,
     get_source_format_for_path,
     get_source_format_for_zipfile,
+    read_output,
     sfdx,
     shell_quote,
 )
@@ -45,6 +46,13 @@ class TestSfdx:
             sfdx("cmd", check_return=True)
         assert str(exc_info.value) == "Command exited with return code 1:\nEgads!"
 
+    @mock.patch("sarge.Command")
+    def test_read_output(self, Command):
+        Command.return_value.stdout = io.BytesIO(b"out\nmore out")
+        Command.return_value.stderr = io.BytesIO(b"err")
+        p = sfdx("cmd")
+        assert read_output(p) == ("out\nmore out", "err")
+
 
 @mock.patch("sarge.Command")
 def test_get_default_devhub_username(Command):